@@ -1,41 +1,72 @@
 """Pytest configuration and fixtures for FastAPI tests."""
 
-import sys
-from pathlib import Path
-
+import httpx
 import pytest
 from fastapi.testclient import TestClient
 
-# Add the src directory to the path so we can import app
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from app import app
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Provide a test client for the FastAPI app."""
-    return TestClient(app)
+    """Provide a test client for the FastAPI app, shared across the session."""
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    """Run async tests on asyncio only."""
+    return "asyncio"
+
+
+@pytest.fixture
+async def aclient():
+    """Provide an async client that calls the FastAPI app in-process."""
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as c:
+        yield c
+
+
+def _restore_participants(snapshot):
+    """Copy snapshotted participants back into any activity that has changed."""
+    from app import activities
+
+    for key, participants in snapshot.items():
+        current = activities[key]["participants"]
+        if current != participants:
+            current[:] = participants
+
+
+@pytest.fixture(scope="session")
+def _activities_snapshot():
+    """Capture the original participants of every activity once per session."""
+    from app import activities
+
+    return {key: value["participants"][:] for key, value in activities.items()}
+
+
+@pytest.fixture(autouse=True)
+def reset_activities(request, _activities_snapshot):
+    """Reset activities participants after each test not marked readonly."""
+    yield
+
+    if request.node.get_closest_marker("readonly"):
+        return
+
+    # Restore original participants after test
+    _restore_participants(_activities_snapshot)
 
 
 @pytest.fixture
 def app_with_fresh_data():
     """Provide app with reset activities data for each test."""
     from app import activities
-    
-    # Store original data
-    original_data = {
-        key: {
-            "description": value["description"],
-            "schedule": value["schedule"],
-            "max_participants": value["max_participants"],
-            "participants": value["participants"].copy()
-        }
-        for key, value in activities.items()
-    }
-    
+
+    # Store original participants
+    original = {key: value["participants"][:] for key, value in activities.items()}
+
     yield app
-    
-    # Restore original data after test
-    for key in list(activities.keys()):
-        activities[key]["participants"] = original_data[key]["participants"].copy()
+
+    # Restore original participants after test
+    _restore_participants(original)